@@ -152,28 +152,28 @@ def simulate_month(
     """
     Simulate one month of agent activity.
     """
+    # Flagged agents get no rewards, so only active agents are visited
+    active = [(a, a.monthly_activity()) for a in agents if not a.is_flagged]
+    
     # Calculate total activity points
-    total_activity = sum(a.monthly_activity() for a in agents if not a.is_flagged)
+    total_activity = sum(activity for _, activity in active)
     
     if total_activity == 0:
         total_activity = 1  # Prevent division by zero
     
+    # Max daily reward cap (converted to monthly) is the same for every agent
+    max_monthly_reward = (params.max_daily_reward_usd / params.token_price) * 30
+    
     # Distribute rewards based on activity share
     total_distributed = 0
     total_staked = 0
     total_sold = 0
     total_held = 0
     
-    for agent in agents:
-        if agent.is_flagged:
-            continue  # Flagged agents get no rewards
-        
+    for agent, activity in active:
         # Calculate reward share
-        activity_share = agent.monthly_activity() / total_activity
+        activity_share = activity / total_activity
         reward = monthly_emission * activity_share
-        
-        # Apply max daily reward cap (converted to monthly)
-        max_monthly_reward = (params.max_daily_reward_usd / params.token_price) * 30
         reward = min(reward, max_monthly_reward)
         
         agent.tokens_earned += reward
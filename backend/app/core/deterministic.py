@@ -369,9 +369,9 @@ def calculate_customer_acquisition(params: SimulationParameters, platform_age_mo
         retention_curve = VCOIN_RETENTION
         if hasattr(params, 'retention') and hasattr(params.retention, 'model_type'):
             model_type = params.retention.model_type
-            if model_type.value in [m.value for m in RetentionModel]:
+            if model_type in [m.value for m in RetentionModel]:
                 retention_curve = RETENTION_CURVES.get(
-                    RetentionModel(model_type.value),
+                    RetentionModel(model_type),
                     VCOIN_RETENTION
                 )
         
@@ -458,7 +458,7 @@ def run_deterministic_simulation(
             GrowthScenario, MarketCondition, 
             GROWTH_SCENARIOS, MARKET_CONDITIONS
         )
-        from app.models import GrowthScenarioType, MarketConditionType
+        from app.models.parameters_enums import GrowthScenarioType, MarketConditionType
         
         # Map parameter enum to core enum
         scenario_map = {
@@ -505,9 +505,9 @@ def run_deterministic_simulation(
         if hasattr(params.retention, 'model_type'):
             model_type = params.retention.model_type
             # Map parameter enum value to RetentionModel enum
-            if model_type.value in [m.value for m in RetentionModel]:
+            if model_type in [m.value for m in RetentionModel]:
                 retention_curve = RETENTION_CURVES.get(
-                    RetentionModel(model_type.value),
+                    RetentionModel(model_type),
                     VCOIN_RETENTION
                 )
         
@@ -743,25 +743,25 @@ def run_deterministic_simulation(
     future_modules_revenue = 0
     future_modules_costs = 0
     
-    if params.vchain and params.vchain.enable_vchain:
+    if params.vchain.enable_vchain:
         vchain_data = calculate_vchain(params, current_month, users, params.token_price)
         vchain_result = filter_model_fields(vchain_data, VChainResult)
         future_modules_revenue += vchain_result.revenue
         future_modules_costs += vchain_result.costs
     
-    if params.marketplace and params.marketplace.enable_marketplace:
+    if params.marketplace.enable_marketplace:
         mp_data = calculate_marketplace(params, current_month, users, params.token_price)
         marketplace_result = filter_model_fields(mp_data, MarketplaceResult)
         future_modules_revenue += marketplace_result.revenue
         future_modules_costs += marketplace_result.costs
     
-    if params.business_hub and params.business_hub.enable_business_hub:
+    if params.business_hub.enable_business_hub:
         bh_data = calculate_business_hub(params, current_month, users, params.token_price)
         business_hub_result = filter_model_fields(bh_data, BusinessHubResult)
         future_modules_revenue += business_hub_result.revenue
         future_modules_costs += business_hub_result.costs
     
-    if params.cross_platform and params.cross_platform.enable_cross_platform:
+    if params.cross_platform.enable_cross_platform:
         cp_data = calculate_cross_platform(params, current_month, users, params.token_price)
         cross_platform_result = filter_model_fields(cp_data, CrossPlatformResult)
         future_modules_revenue += cross_platform_result.revenue
@@ -1259,7 +1259,7 @@ def run_deterministic_simulation(
     viral_coefficient = 0.5  # Default
     if hasattr(params, 'use_growth_scenarios') and params.use_growth_scenarios:
         from app.core.growth_scenarios import GrowthScenario, GROWTH_SCENARIOS
-        from app.models import GrowthScenarioType
+        from app.models.parameters_enums import GrowthScenarioType
         scenario_map = {
             GrowthScenarioType.CONSERVATIVE: GrowthScenario.CONSERVATIVE,
             GrowthScenarioType.BASE: GrowthScenario.BASE,
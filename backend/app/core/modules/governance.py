@@ -463,7 +463,7 @@ def calculate_governance(
         }
     
     token_price = params.token_price
-    platform_maturity = params.platform_maturity.value
+    platform_maturity = params.platform_maturity
     
     # Get user-configured governance parameters
     user_participation_rate = getattr(params, 'governance_participation_rate', None)
@@ -24,8 +24,9 @@ def add_noise_to_parameters(
     Uses appropriate distributions for each parameter type.
     Bounds are relative to base values (0.5x to 2x) to prevent extreme skew.
     """
-    # Create a copy of params as dict
-    param_dict = params.model_dump()
+    # Only the varied fields are collected; everything else is shared
+    # with the already-validated base parameters
+    param_dict = {}
     
     # Token price - log-normal distribution (prices tend to be log-normal)
     # Clip to 0.5x to 2x of base price
@@ -79,7 +80,16 @@ def add_noise_to_parameters(
         min(0.5, params.buyback_percent * 1.5)
     )
     
-    return SimulationParameters(**param_dict)
+    # sweep_variant does not validate, so keep every draw inside its
+    # field's declared bounds (the relative clips above can exceed them).
+    # burn_rate and buyback_percent are each capped at 0.25, so together
+    # they stay within the combined deflation cap
+    names = list(param_dict)
+    lows, highs = SimulationParameters.field_bounds(names)
+    values = np.clip([param_dict[name] for name in names], lows, highs)
+    param_dict = dict(zip(names, values.tolist()))
+    
+    return SimulationParameters.sweep_variant(params, **param_dict)
 
 
 def run_monte_carlo_simulation(
@@ -105,28 +105,28 @@ def calculate_future_modules_revenue(
     }
     
     # VChain
-    if params.vchain and params.vchain.enable_vchain:
+    if params.vchain.enable_vchain:
         vchain_result = calculate_vchain(params, current_month, users, token_price)
         results['vchain'] = vchain_result
         results['total_revenue'] += vchain_result.get('revenue', 0)
         results['total_profit'] += vchain_result.get('profit', 0)
     
     # Marketplace
-    if params.marketplace and params.marketplace.enable_marketplace:
+    if params.marketplace.enable_marketplace:
         marketplace_result = calculate_marketplace(params, current_month, users, token_price)
         results['marketplace'] = marketplace_result
         results['total_revenue'] += marketplace_result.get('revenue', 0)
         results['total_profit'] += marketplace_result.get('profit', 0)
     
     # Business Hub
-    if params.business_hub and params.business_hub.enable_business_hub:
+    if params.business_hub.enable_business_hub:
         bh_result = calculate_business_hub(params, current_month, users, token_price)
         results['business_hub'] = bh_result
         results['total_revenue'] += bh_result.get('revenue', 0)
         results['total_profit'] += bh_result.get('profit', 0)
     
     # Cross-Platform
-    if params.cross_platform and params.cross_platform.enable_cross_platform:
+    if params.cross_platform.enable_cross_platform:
         cp_result = calculate_cross_platform(params, current_month, users, token_price)
         results['cross_platform'] = cp_result
         results['total_revenue'] += cp_result.get('revenue', 0)
@@ -669,9 +669,9 @@ def run_monthly_progression_simulation(
     retention_curve = VCOIN_RETENTION
     if hasattr(params, 'retention') and params.retention:
         model_type = params.retention.model_type
-        if model_type.value in [m.value for m in RetentionModel]:
+        if model_type in [m.value for m in RetentionModel]:
             retention_curve = RETENTION_CURVES.get(
-                RetentionModel(model_type.value), 
+                RetentionModel(model_type), 
                 VCOIN_RETENTION
             )
     
@@ -797,6 +797,11 @@ def run_monthly_progression_simulation(
     current_calendar_year = start_year
     current_calendar_month = start_month
     
+    # Compliance costs are fixed per run, so resolve them once up front
+    compliance_cost = 0
+    if params.include_compliance_costs and hasattr(params, 'compliance'):
+        compliance_cost = params.compliance.monthly_total
+    
     for month in range(1, duration_months + 1):
         # Apply seasonality to marketing effectiveness
         seasonality = calculate_seasonality_multiplier(month, include_seasonality)
@@ -992,12 +997,13 @@ def run_monthly_progression_simulation(
         
         # Run deterministic simulation for this month's active users
         # Create a modified params with current active users
-        month_params = params.model_copy()
-        month_params.starting_users = active_users
-        # Disable retention in deterministic sim - cohort tracker already handles retention
-        month_params.apply_retention = False
-        # Disable growth scenarios in deterministic sim - we handle them separately
-        month_params.use_growth_scenarios = False
+        month_params = params.model_copy(update={
+            'starting_users': active_users,
+            # Disable retention in deterministic sim - cohort tracker already handles retention
+            'apply_retention': False,
+            # Disable growth scenarios in deterministic sim - we handle them separately
+            'use_growth_scenarios': False,
+        })
         
         # Run simulation with current month for accurate circulating supply
         # and unified budget constraint enforcement
@@ -1015,11 +1021,6 @@ def run_monthly_progression_simulation(
         tokens_recaptured = sim_result.recapture.total_recaptured
         recapture_rate = sim_result.recapture.recapture_rate
         
-        # Add compliance costs if enabled
-        compliance_cost = 0
-        if params.include_compliance_costs and hasattr(params, 'compliance'):
-            compliance_cost = params.compliance.monthly_total
-        
         month_costs = sim_result.totals.costs + compliance_cost
         month_profit = month_revenue - month_costs
         month_margin = (month_profit / month_revenue * 100) if month_revenue > 0 else 0
@@ -1407,6 +1408,11 @@ def run_growth_scenario_simulation(
         'active': 0, 'power_users': 0
     }
     
+    # Compliance costs are fixed per run, so resolve them once up front
+    compliance_cost = 0
+    if params.include_compliance_costs and hasattr(params, 'compliance'):
+        compliance_cost = params.compliance.monthly_total
+    
     for month in range(1, duration_months + 1):
         # Calculate base token price for this month
         token_price = calculate_token_price(
@@ -1486,13 +1492,14 @@ def run_growth_scenario_simulation(
         seasonality = calculate_seasonality_multiplier(month, include_seasonality)
         
         # Run deterministic simulation for this month's active users
-        month_params = params.model_copy()
-        month_params.starting_users = active_users
-        month_params.token_price = token_price
-        # Disable retention in deterministic sim - we already handle retention in monthly progression
-        month_params.apply_retention = False
-        # Disable growth scenarios in deterministic sim - we already handle them in monthly progression
-        month_params.use_growth_scenarios = False
+        month_params = params.model_copy(update={
+            'starting_users': active_users,
+            'token_price': token_price,
+            # Disable retention in deterministic sim - we already handle retention in monthly progression
+            'apply_retention': False,
+            # Disable growth scenarios in deterministic sim - we already handle them in monthly progression
+            'use_growth_scenarios': False,
+        })
         
         # Run simulation with current month for accurate circulating supply
         # and unified budget constraint enforcement
@@ -1507,11 +1514,6 @@ def run_growth_scenario_simulation(
         tokens_recaptured = sim_result.recapture.total_recaptured
         recapture_rate = sim_result.recapture.recapture_rate
         
-        # Add compliance costs if enabled
-        compliance_cost = 0
-        if params.include_compliance_costs and hasattr(params, 'compliance'):
-            compliance_cost = params.compliance.monthly_total
-        
         month_costs = sim_result.totals.costs + compliance_cost
         month_profit = month_revenue - month_costs
         month_margin = (month_profit / month_revenue * 100) if month_revenue > 0 else 0
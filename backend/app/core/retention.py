@@ -19,7 +19,8 @@ Social App Retention Benchmarks (2024-2025):
 - Day 365 retention: 2-4%
 """
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import math
@@ -44,12 +45,29 @@ class RetentionCurve:
     description: str
     # Monthly retention rates (month -> % retained from original cohort)
     monthly_rates: Dict[int, float]
+    # Defined months in order, and rates already resolved per month
+    _months: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _resolved: Dict[int, float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_months', tuple(sorted(self.monthly_rates)))
+        object.__setattr__(self, '_resolved', {})
     
     def get_retention_at_month(self, month: int) -> float:
         """
         Get retention rate for a specific month.
         Interpolates between defined points using exponential decay.
+        
+        Each month is resolved once per curve; cohort tracking asks for
+        the same months over and over.
         """
+        rate = self._resolved.get(month)
+        if rate is None:
+            rate = self._resolved[month] = self._resolve_month(month)
+        return rate
+    
+    def _resolve_month(self, month: int) -> float:
+        """Retention for one month from the defined points"""
         if month <= 0:
             return 1.0
         
@@ -57,7 +75,7 @@ class RetentionCurve:
             return self.monthly_rates[month]
         
         # Find surrounding months for interpolation
-        months = sorted(self.monthly_rates.keys())
+        months = self._months
         
         if month < months[0]:
             # Before first defined point - interpolate from 1.0
@@ -71,12 +89,10 @@ class RetentionCurve:
             months_after = month - last_month
             return max(0.01, last_rate * (0.98 ** months_after))
         
-        # Find bracketing months
-        lower_month = max(m for m in months if m <= month)
-        upper_month = min(m for m in months if m >= month)
-        
-        if lower_month == upper_month:
-            return self.monthly_rates[lower_month]
+        # Find bracketing months (month itself is not a defined point here)
+        upper_index = bisect_left(months, month)
+        lower_month = months[upper_index - 1]
+        upper_month = months[upper_index]
         
         return self._interpolate(
             lower_month, self.monthly_rates[lower_month],
@@ -10,8 +10,9 @@ Provides:
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
-import random
-import math
+from operator import itemgetter
+
+import numpy as np
 
 
 class StressScenario(Enum):
@@ -174,38 +175,44 @@ def run_stress_test(
         'cac': base_metrics.get('cac', 50) * config.cac_multiplier,
     }
     
-    # Calculate recovery curve
-    recovery_curve = []
-    for month in range(months_to_simulate):
-        # Recovery follows logistic curve
-        if month < config.recovery_months:
-            recovery_percent = month / config.recovery_months
-            # Logistic recovery
-            recovery_factor = 1 / (1 + math.exp(-10 * (recovery_percent - 0.5)))
+    # Calculate recovery curve (whole horizon at once)
+    months = np.arange(months_to_simulate)
+    # Recovery follows logistic curve, then settles at the permanent impact level
+    recovery_percent = months / max(config.recovery_months, 1)
+    recovery_factor = np.where(
+        months < config.recovery_months,
+        1 / (1 + np.exp(-10 * (recovery_percent - 0.5))),
+        1.0 - config.permanent_impact_percent,
+    )
+    
+    curve_series = {}
+    for key, impacted_value in impacted_metrics.items():
+        base_value = base_metrics.get(key, impacted_value)
+        if key == 'cac':
+            # CAC recovery is inverse
+            final_base = base_value
+            series = impacted_value - (impacted_value - final_base) * recovery_factor
         else:
-            recovery_factor = 1.0 - config.permanent_impact_percent
-        
-        month_metrics = {}
-        for key, impacted_value in impacted_metrics.items():
-            base_value = base_metrics.get(key, impacted_value)
-            if key == 'cac':
-                # CAC recovery is inverse
-                final_base = base_value
-                month_metrics[key] = impacted_value - (impacted_value - final_base) * recovery_factor
-            else:
-                final_target = base_value * (1 - config.permanent_impact_percent)
-                month_metrics[key] = impacted_value + (final_target - impacted_value) * recovery_factor
-        
-        recovery_curve.append({
+            final_target = base_value * (1 - config.permanent_impact_percent)
+            series = impacted_value + (final_target - impacted_value) * recovery_factor
+        # Python round, not np.round: they disagree on some ties (0.225 -> 0.23 vs 0.22)
+        curve_series[key] = [round(value, 2) for value in series.tolist()]
+    
+    recovery_percent_rounded = [round(value * 100, 1) for value in recovery_factor.tolist()]
+    recovery_curve = [
+        {
             'month': month + 1,
-            'recovery_percent': round(recovery_factor * 100, 1),
-            **{k: round(v, 2) for k, v in month_metrics.items()}
-        })
+            'recovery_percent': recovery_percent_rounded[month],
+            **{k: v[month] for k, v in curve_series.items()}
+        }
+        for month in range(months_to_simulate)
+    ]
     
     # Calculate total impact
+    base_revenue = base_metrics.get('monthly_revenue', 10000)
     total_revenue_loss = sum(
-        base_metrics.get('monthly_revenue', 10000) - curve['monthly_revenue']
-        for curve in recovery_curve
+        base_revenue - revenue
+        for revenue in curve_series['monthly_revenue']
     )
     
     max_drawdown = {
@@ -297,31 +304,33 @@ def run_monte_carlo_sensitivity(
     Returns:
         Dict with P5, P50, P95 outcomes and distribution data
     """
-    if seed is not None:
-        random.seed(seed)
-    
-    results = []
-    
-    for _ in range(iterations):
-        # Sample parameters
-        sampled_params = {}
-        for param, base_val in base_params.items():
-            if param in param_ranges:
-                min_val, max_val = param_ranges[param]
-                sampled_params[param] = random.uniform(min_val, max_val)
-            else:
-                sampled_params[param] = base_val
-        
-        # Calculate result (simplified - real impl would run full simulation)
-        # This is a placeholder that combines parameters
-        result = sum(sampled_params.values()) / len(sampled_params)
-        results.append({
-            'params': sampled_params.copy(),
-            'result': result,
-        })
+    if not base_params:
+        raise ValueError("base_params must contain at least one parameter")
+    
+    # Private SFC64-backed generator: no global random state shared between runs
+    rng = np.random.Generator(np.random.SFC64(seed))
+    
+    param_names = list(base_params)
+    sampled_names = [p for p in param_names if p in param_ranges]
+    fixed_total = sum(v for p, v in base_params.items() if p not in param_ranges)
+    
+    # Ranges may be given as (high, low), which random.uniform used to
+    # accept; order each pair so the vectorized draw does too
+    bounds_a = np.array([param_ranges[p][0] for p in sampled_names], dtype=np.float64)
+    bounds_b = np.array([param_ranges[p][1] for p in sampled_names], dtype=np.float64)
+    lows = np.minimum(bounds_a, bounds_b)
+    highs = np.maximum(bounds_a, bounds_b)
+    
+    # Draw every iteration's samples in one call: shape (iterations, k)
+    samples = rng.uniform(lows, highs, size=(iterations, len(sampled_names)))
+    
+    # Calculate result (simplified - real impl would run full simulation)
+    # This is a placeholder that combines parameters
+    result_values = (fixed_total + samples.sum(axis=1)) / len(param_names)
     
     # Sort by result
-    sorted_results = sorted(results, key=lambda x: x['result'])
+    order = np.argsort(result_values, kind='stable')
+    sorted_values = result_values[order]
     
     # Calculate percentiles
     p5_idx = int(iterations * 0.05)
@@ -330,84 +339,130 @@ def run_monte_carlo_sensitivity(
     p75_idx = int(iterations * 0.75)
     p95_idx = int(iterations * 0.95)
     
-    result_values = [r['result'] for r in sorted_results]
+    def iteration_case(sorted_idx: int) -> Dict[str, any]:
+        """Materialize the sampled parameters of one sorted iteration"""
+        row = order[sorted_idx]
+        sampled_params = dict(base_params)
+        for col, param in enumerate(sampled_names):
+            sampled_params[param] = float(samples[row, col])
+        return {
+            'params': sampled_params,
+            'result': float(result_values[row]),
+        }
     
     return {
         'iterations': iterations,
         'percentiles': {
-            'P5': round(result_values[p5_idx], 4),
-            'P25': round(result_values[p25_idx], 4),
-            'P50': round(result_values[p50_idx], 4),
-            'P75': round(result_values[p75_idx], 4),
-            'P95': round(result_values[p95_idx], 4),
+            'P5': round(float(sorted_values[p5_idx]), 4),
+            'P25': round(float(sorted_values[p25_idx]), 4),
+            'P50': round(float(sorted_values[p50_idx]), 4),
+            'P75': round(float(sorted_values[p75_idx]), 4),
+            'P95': round(float(sorted_values[p95_idx]), 4),
         },
         'statistics': {
-            'mean': round(sum(result_values) / len(result_values), 4),
-            'min': round(min(result_values), 4),
-            'max': round(max(result_values), 4),
-            'std_dev': round(
-                (sum((x - sum(result_values)/len(result_values))**2 for x in result_values) / len(result_values)) ** 0.5,
-                4
-            ),
+            'mean': round(float(result_values.mean()), 4),
+            'min': round(float(sorted_values[0]), 4),
+            'max': round(float(sorted_values[-1]), 4),
+            'std_dev': round(float(result_values.std()), 4),
         },
-        'worst_case': sorted_results[p5_idx],
-        'best_case': sorted_results[p95_idx],
-        'base_case': sorted_results[p50_idx],
+        'worst_case': iteration_case(p5_idx),
+        'best_case': iteration_case(p95_idx),
+        'base_case': iteration_case(p50_idx),
     }
 
 
+# Impact ratings: -3 (strong negative) to +3 (strong positive)
+# These are example values - real implementation would calculate from data
+DEFAULT_IMPACTS: Dict[Tuple[str, str], int] = {
+    ('token_price', 'revenue'): 2,
+    ('token_price', 'user_growth'): 1,
+    ('token_price', 'staking'): 2,
+    ('burn_rate', 'price'): 2,
+    ('burn_rate', 'supply'): -3,
+    ('buyback_rate', 'price'): 2,
+    ('staking_apy', 'staking'): 3,
+    ('staking_apy', 'sell_pressure'): -2,
+    ('cac', 'user_growth'): -2,
+    ('cac', 'profitability'): -2,
+    ('retention', 'ltv'): 3,
+    ('retention', 'revenue'): 2,
+    ('ad_cpm', 'revenue'): 2,
+    ('conversion_rate', 'revenue'): 3,
+    ('liquidity', 'price_stability'): 2,
+    ('liquidity', 'slippage'): -2,
+}
+
+# Canonical parameter/metric axes (first-seen order of DEFAULT_IMPACTS)
+IMPACT_PARAMETERS: Tuple[str, ...] = tuple(dict.fromkeys(p for p, _ in DEFAULT_IMPACTS))
+IMPACT_METRICS: Tuple[str, ...] = tuple(dict.fromkeys(m for _, m in DEFAULT_IMPACTS))
+
+# Cell label lookup tables, keyed by impact rating
+_IMPACT_LEVELS: Dict[int, str] = {
+    impact: 'High' if abs(impact) >= 2 else 'Medium' if abs(impact) >= 1 else 'Low'
+    for impact in range(-3, 4)
+}
+_IMPACT_DIRECTIONS: Dict[int, str] = {
+    impact: 'positive' if impact > 0 else 'negative' if impact < 0 else 'neutral'
+    for impact in range(-3, 4)
+}
+
+
+def _build_impact_matrix(
+    parameters: List[str],
+    metrics: List[str],
+    include_cells: bool = False
+) -> Dict[str, any]:
+    """Build the impact matrix payload for the given axes."""
+    impact_matrix = [
+        [DEFAULT_IMPACTS.get((param, metric), 0) for metric in metrics]
+        for param in parameters
+    ]
+    level_matrix = [[_IMPACT_LEVELS[impact] for impact in row] for row in impact_matrix]
+    direction_matrix = [[_IMPACT_DIRECTIONS[impact] for impact in row] for row in impact_matrix]
+    
+    result = {
+        'parameters': parameters,
+        'metrics': metrics,
+        'impact_matrix': impact_matrix,
+        'level_matrix': level_matrix,
+        'direction_matrix': direction_matrix,
+    }
+    
+    if include_cells:
+        result['matrix'] = {
+            param: {
+                metric: {'impact': impact, 'level': level, 'direction': direction}
+                for metric, impact, level, direction in zip(metrics, impacts, levels, directions)
+            }
+            for param, impacts, levels, directions in zip(
+                parameters, impact_matrix, level_matrix, direction_matrix
+            )
+        }
+    
+    return result
+
+
 def generate_impact_matrix(
     parameters: List[str],
-    metrics: List[str]
+    metrics: List[str],
+    include_cells: bool = True
 ) -> Dict[str, any]:
     """
     Generate parameter impact matrix showing how each parameter affects each metric.
     
+    The matrix is returned as three parallel row-major grids (impact rating,
+    level, direction) indexed like `parameters` x `metrics`, alongside the
+    nested per-cell `matrix` dict unless `include_cells` is cleared.
+    
     Args:
         parameters: List of parameter names
         metrics: List of metric names
+        include_cells: Also return the nested param -> metric -> cell dict (default True)
     
     Returns:
         Dict with impact matrix
     """
-    # Impact ratings: -3 (strong negative) to +3 (strong positive)
-    # These are example values - real implementation would calculate from data
-    
-    default_impacts = {
-        ('token_price', 'revenue'): 2,
-        ('token_price', 'user_growth'): 1,
-        ('token_price', 'staking'): 2,
-        ('burn_rate', 'price'): 2,
-        ('burn_rate', 'supply'): -3,
-        ('buyback_rate', 'price'): 2,
-        ('staking_apy', 'staking'): 3,
-        ('staking_apy', 'sell_pressure'): -2,
-        ('cac', 'user_growth'): -2,
-        ('cac', 'profitability'): -2,
-        ('retention', 'ltv'): 3,
-        ('retention', 'revenue'): 2,
-        ('ad_cpm', 'revenue'): 2,
-        ('conversion_rate', 'revenue'): 3,
-        ('liquidity', 'price_stability'): 2,
-        ('liquidity', 'slippage'): -2,
-    }
-    
-    matrix = {}
-    for param in parameters:
-        matrix[param] = {}
-        for metric in metrics:
-            impact = default_impacts.get((param, metric), 0)
-            matrix[param][metric] = {
-                'impact': impact,
-                'level': 'High' if abs(impact) >= 2 else 'Medium' if abs(impact) >= 1 else 'Low',
-                'direction': 'positive' if impact > 0 else 'negative' if impact < 0 else 'neutral',
-            }
-    
-    return {
-        'parameters': parameters,
-        'metrics': metrics,
-        'matrix': matrix,
-    }
+    return _build_impact_matrix(parameters, metrics, include_cells)
 
 
 def run_all_stress_tests(
@@ -423,29 +478,24 @@ def run_all_stress_tests(
         Dict with all stress test results and comparison
     """
     results = {}
+    severity_entries = []
     
     for scenario in StressScenario:
-        results[scenario.value] = run_stress_test(scenario, base_metrics)
+        data = run_stress_test(scenario, base_metrics)
+        results[scenario.value] = data
+        severity_entries.append({
+            'scenario': scenario.value,
+            'revenue_loss': data['total_revenue_loss'],
+            'recovery_months': data['recovery_months'],
+            'permanent_impact': data['permanent_impact_percent'],
+        })
     
     # Rank scenarios by severity
-    severity_ranking = sorted(
-        results.items(),
-        key=lambda x: x[1]['total_revenue_loss'],
-        reverse=True
-    )
+    severity_entries.sort(key=itemgetter('revenue_loss'), reverse=True)
     
     return {
         'scenarios': results,
-        'severity_ranking': [
-            {
-                'scenario': scenario,
-                'revenue_loss': data['total_revenue_loss'],
-                'recovery_months': data['recovery_months'],
-                'permanent_impact': data['permanent_impact_percent'],
-            }
-            for scenario, data in severity_ranking
-        ],
-        'worst_scenario': severity_ranking[0][0],
-        'least_severe_scenario': severity_ranking[-1][0],
+        'severity_ranking': severity_entries,
+        'worst_scenario': severity_entries[0]['scenario'],
+        'least_severe_scenario': severity_entries[-1]['scenario'],
     }
-
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 
 @dataclass
 class WhaleHolder:
@@ -62,21 +64,35 @@ def calculate_whale_concentration(
     if not holder_balances or len(holder_balances) == 0:
         return _empty_result()
     
-    # Sort descending (largest holders first)
-    sorted_balances = sorted(holder_balances, reverse=True)
-    n = len(sorted_balances)
-    total_held = sum(sorted_balances)
+    balances = np.asarray(holder_balances, dtype=np.float64)
+    n = balances.size
+    total_held = float(balances.sum())
+    
+    # Percentile cutoffs
+    top_1_pct_idx = max(1, int(n * 0.01))
+    top_5_pct_idx = max(1, int(n * 0.05))
+    top_10_pct_idx = max(1, int(n * 0.10))
+    
+    # Only the largest max(100, top 10%) holders are ever ranked, so select
+    # them with an O(n) partition and sort just that slice (descending)
+    top_k = min(n, max(100, top_10_pct_idx))
+    if top_k < n:
+        top_balances = balances[np.argpartition(balances, n - top_k)[n - top_k:]]
+    else:
+        top_balances = balances
+    top_balances = np.sort(top_balances)[::-1]
+    top_cumsum = np.cumsum(top_balances)
     
     # Calculate top holder concentrations
     def get_concentration(top_n: int) -> Dict:
-        top_holders = sorted_balances[:min(top_n, n)]
-        amount = sum(top_holders)
+        count = min(top_n, n)
+        amount = float(top_cumsum[count - 1])
         return {
-            'holders_count': min(top_n, n),
+            'holders_count': count,
             'amount_vcoin': amount,
             'amount_usd': amount * token_price,
             'percentage': (amount / total_supply * 100) if total_supply > 0 else 0,
-            'avg_balance': amount / min(top_n, n) if top_n > 0 else 0,
+            'avg_balance': amount / count if top_n > 0 else 0,
         }
     
     # Top holder groups
@@ -85,49 +101,40 @@ def calculate_whale_concentration(
     top_100 = get_concentration(100)
     
     # Percentile concentrations
-    top_1_pct_idx = max(1, int(n * 0.01))
-    top_5_pct_idx = max(1, int(n * 0.05))
-    top_10_pct_idx = max(1, int(n * 0.10))
-    
     top_1_percent = get_concentration(top_1_pct_idx)
     top_5_percent = get_concentration(top_5_pct_idx)
     top_10_percent = get_concentration(top_10_pct_idx)
     
-    # Identify whale categories
-    whales = []
-    large_holders = []
-    medium_holders = []
-    small_holders = []
-    
-    for i, balance in enumerate(sorted_balances):
-        pct = (balance / total_supply * 100) if total_supply > 0 else 0
-        holder = WhaleHolder(
+    # Identify whale categories (counts need no ordering)
+    if total_supply > 0:
+        percentages = balances / total_supply * 100
+    else:
+        percentages = np.zeros(n)
+    whale_mask = percentages >= 1.0                                # 1%+ = whale
+    large_count = int(((percentages >= 0.1) & ~whale_mask).sum())  # 0.1-1% = large
+    medium_count = int(((percentages >= 0.01) & (percentages < 0.1)).sum())  # 0.01-0.1% = medium
+    whale_count = int(whale_mask.sum())
+    small_count = n - whale_count - large_count - medium_count
+    
+    # Whales are the largest holders, so the top 20 lead the sorted slice
+    whales = [
+        WhaleHolder(
             rank=i + 1,
-            balance=balance,
-            percentage=pct,
-            category="small"
+            balance=float(balance),
+            percentage=float(balance / total_supply * 100),
+            category="whale",
         )
-        
-        if pct >= 1.0:  # 1%+ = whale
-            holder.category = "whale"
-            whales.append(holder)
-        elif pct >= 0.1:  # 0.1-1% = large
-            holder.category = "large"
-            large_holders.append(holder)
-        elif pct >= 0.01:  # 0.01-0.1% = medium
-            holder.category = "medium"
-            medium_holders.append(holder)
-        else:
-            small_holders.append(holder)
+        for i, balance in enumerate(top_balances[:min(20, whale_count)])
+    ]
     
     # Calculate concentration risk score (0-100, higher = more risky)
     # Based on: top 10 concentration, whale count, Gini
     top_10_risk = min(100, top_10['percentage'] * 2)  # 50% top 10 = 100 risk
-    whale_risk = min(100, len(whales) * 5)  # 20 whales = 100 risk (inverted - more whales = distributed)
+    whale_risk = min(100, whale_count * 5)  # 20 whales = 100 risk (inverted - more whales = distributed)
     
     # Adjust: fewer whales with more % = higher risk
-    if len(whales) > 0:
-        avg_whale_pct = sum(w.percentage for w in whales) / len(whales)
+    if whale_count > 0:
+        avg_whale_pct = float(percentages[whale_mask].sum()) / whale_count
         whale_concentration_risk = min(100, avg_whale_pct * 10)
     else:
         whale_concentration_risk = 0
@@ -150,7 +157,7 @@ def calculate_whale_concentration(
     
     # Run dump scenarios
     dump_scenarios = run_dump_scenarios(
-        sorted_balances[:100],  # Top 100 holders
+        top_balances[:100].tolist(),  # Top 100 holders
         total_supply,
         token_price,
         liquidity_pool_usd
@@ -173,17 +180,17 @@ def calculate_whale_concentration(
         'top_10_percent': top_10_percent,
         
         # Whale breakdown
-        'whale_count': len(whales),
-        'large_holder_count': len(large_holders),
-        'medium_holder_count': len(medium_holders),
-        'small_holder_count': len(small_holders),
+        'whale_count': whale_count,
+        'large_holder_count': large_count,
+        'medium_holder_count': medium_count,
+        'small_holder_count': small_count,
         
         'whales': [
             {
                 'rank': w.rank,
                 'balance': w.balance,
                 'percentage': round(w.percentage, 4),
-            } for w in whales[:20]  # Top 20 whales
+            } for w in whales  # Top 20 whales
         ],
         
         # Risk metrics
@@ -197,7 +204,7 @@ def calculate_whale_concentration(
         # Recommendations
         'recommendations': _generate_recommendations(
             concentration_risk_score,
-            len(whales),
+            whale_count,
             top_10['percentage']
         ),
     }
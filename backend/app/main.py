@@ -2,14 +2,29 @@
 ViWO Token Economy Simulator - FastAPI Backend
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import simulation, websocket, export
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the process pool used for CPU-bound sensitivity analysis"""
+    app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown(cancel_futures=True)
+
+
 app = FastAPI(
     title="ViWO Token Economy Simulator",
     description="Backend API for token economy simulations with deterministic, Monte Carlo, and Agent-Based modeling",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend
@@ -52,6 +67,8 @@ async def root():
             "deterministic": "/api/simulate/deterministic",
             "monte_carlo": "/api/simulate/monte-carlo",
             "agent_based": "/api/simulate/agent-based",
+            "stress_tests": "/api/sensitivity/stress-tests",
+            "sensitivity_monte_carlo": "/api/sensitivity/monte-carlo",
             "websocket": "/ws/simulation/{job_id}",
         }
     }
@@ -1,129 +1,95 @@
-from .parameters import (
-    SimulationParameters, 
-    MonteCarloOptions, 
-    AgentBasedOptions,
-    MonthlyProgressionOptions,
-    PlatformMaturity,
-    RetentionModelType,
-    RetentionParameters,
-    ComplianceCosts,
-    RegionalComplianceCosts,
-    MATURITY_ADJUSTMENTS,
+"""
+Simulation parameter and result models.
+
+Names are imported from their submodule on first access, so light modules
+such as app.models.parameters_enums can be imported without loading
+pydantic or numpy.
+"""
+
+from importlib import import_module
+
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'SimulationParameters': 'parameters',
+    'MonteCarloOptions': 'parameters',
+    'AgentBasedOptions': 'parameters',
+    'MonthlyProgressionOptions': 'parameters',
+    'StressTestOptions': 'parameters',
+    'SensitivityMonteCarloOptions': 'parameters',
+    'PlatformMaturity': 'parameters_enums',
+    'RetentionModelType': 'parameters_enums',
+    'RetentionParameters': 'parameters',
+    'ComplianceCosts': 'parameters',
+    'RegionalComplianceCosts': 'parameters',
+    'MATURITY_ADJUSTMENTS': 'parameters_enums',
+    'MaturityParams': 'parameters_enums',
+    'maturity_params': 'parameters_enums',
     # Growth scenario types (Nov 2025)
-    GrowthScenarioType,
-    MarketConditionType,
+    'GrowthScenarioType': 'parameters_enums',
+    'MarketConditionType': 'parameters_enums',
     # Future module parameters (Nov 2025)
-    VChainParameters,
-    MarketplaceParameters,
-    BusinessHubParameters,
-    CrossPlatformParameters,
+    'VChainParameters': 'parameters',
+    'MarketplaceParameters': 'parameters',
+    'BusinessHubParameters': 'parameters',
+    'CrossPlatformParameters': 'parameters',
     # Pre-launch module parameters (Nov 2025)
-    ReferralParameters,
-    PointsParameters,
-    GaslessParameters,
-)
-from .results import (
-    ModuleResult,
-    RecaptureResult,
-    RewardsResult,
-    PlatformFeesResult,
-    CustomerAcquisitionMetrics,
-    TotalsResult,
-    StartingUsersSummary,
-    SimulationResult,
-    MonteCarloResult,
-    AgentBasedResult,
-    AgentResult,
-    PercentileResults,
-    StatisticsResult,
-    MarketDynamics,
-    SystemMetrics,
-    WebSocketProgress,
-    WebSocketComplete,
-    WebSocketError,
-    MonthlyMetricsResult,
-    MonthlyProgressionResult,
+    'ReferralParameters': 'parameters',
+    'PointsParameters': 'parameters',
+    'GaslessParameters': 'parameters',
+    'ModuleResult': 'results',
+    'RecaptureResult': 'results',
+    'RewardsResult': 'results',
+    'PlatformFeesResult': 'results',
+    'CustomerAcquisitionMetrics': 'results',
+    'TotalsResult': 'results',
+    'StartingUsersSummary': 'results',
+    'SimulationResult': 'results',
+    'MonteCarloResult': 'results',
+    'AgentBasedResult': 'results',
+    'AgentResult': 'results',
+    'PercentileResults': 'results',
+    'StatisticsResult': 'results',
+    'MarketDynamics': 'results',
+    'SystemMetrics': 'results',
+    'WebSocketProgress': 'results',
+    'WebSocketComplete': 'results',
+    'WebSocketError': 'results',
+    'MonthlyMetricsResult': 'results',
+    'MonthlyProgressionResult': 'results',
     # NEW: Nov 2025
-    LiquidityResult,
-    StakingResult,
+    'LiquidityResult': 'results',
+    'StakingResult': 'results',
     # Growth scenario results (Nov 2025)
-    FomoEventResult,
-    GrowthProjectionResult,
+    'FomoEventResult': 'results',
+    'GrowthProjectionResult': 'results',
     # Governance & future modules (Nov 2025)
-    GovernanceResult,
-    VChainResult,
-    MarketplaceResult,
-    BusinessHubResult,
-    CrossPlatformResult,
-    TokenMetricsResult,
-    SensitivityResult,
+    'GovernanceResult': 'results',
+    'VChainResult': 'results',
+    'MarketplaceResult': 'results',
+    'BusinessHubResult': 'results',
+    'CrossPlatformResult': 'results',
+    'TokenMetricsResult': 'results',
+    'SensitivityResult': 'results',
     # Pre-launch module results (Nov 2025)
-    ReferralResult,
-    PointsResult,
-    GaslessResult,
-    PreLaunchResult,
-)
+    'ReferralResult': 'results',
+    'PointsResult': 'results',
+    'GaslessResult': 'results',
+    'PreLaunchResult': 'results',
+}
 
-__all__ = [
-    # Parameters
-    'SimulationParameters',
-    'MonteCarloOptions',
-    'AgentBasedOptions',
-    'MonthlyProgressionOptions',
-    'PlatformMaturity',
-    'RetentionModelType',
-    'RetentionParameters',
-    'ComplianceCosts',
-    'RegionalComplianceCosts',
-    'MATURITY_ADJUSTMENTS',
-    'GrowthScenarioType',
-    'MarketConditionType',
-    # Future module parameters
-    'VChainParameters',
-    'MarketplaceParameters',
-    'BusinessHubParameters',
-    'CrossPlatformParameters',
-    # Pre-launch module parameters
-    'ReferralParameters',
-    'PointsParameters',
-    'GaslessParameters',
-    # Results
-    'ModuleResult',
-    'RecaptureResult',
-    'RewardsResult',
-    'PlatformFeesResult',
-    'CustomerAcquisitionMetrics',
-    'TotalsResult',
-    'StartingUsersSummary',
-    'SimulationResult',
-    'MonteCarloResult',
-    'AgentBasedResult',
-    'AgentResult',
-    'PercentileResults',
-    'StatisticsResult',
-    'MarketDynamics',
-    'SystemMetrics',
-    'WebSocketProgress',
-    'WebSocketComplete',
-    'WebSocketError',
-    'MonthlyMetricsResult',
-    'MonthlyProgressionResult',
-    # NEW: Nov 2025
-    'LiquidityResult',
-    'StakingResult',
-    'FomoEventResult',
-    'GrowthProjectionResult',
-    # Governance & future modules
-    'GovernanceResult',
-    'VChainResult',
-    'MarketplaceResult',
-    'BusinessHubResult',
-    'CrossPlatformResult',
-    'TokenMetricsResult',
-    'SensitivityResult',
-    # Pre-launch module results
-    'ReferralResult',
-    'PointsResult',
-    'GaslessResult',
-    'PreLaunchResult',
-]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,97 +7,145 @@ Addresses Issues #2, #3, #4, #5, #8, #11, #12, #13 from the audit.
 Nov 2025: Added growth scenario parameters for user growth projections.
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Optional
 from enum import Enum
 
+from pydantic import (
+    BaseModel, BeforeValidator, ConfigDict, Field, ValidationInfo, computed_field,
+    field_validator, model_validator,
+)
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Annotated, Any, ClassVar, Dict, Iterable, Mapping, Optional, Tuple, Type,
+    TypeVar,
+)
 
-class GrowthScenarioType(str, Enum):
-    """Growth scenario selection for user projections"""
-    CONSERVATIVE = "conservative"
-    BASE = "base"
-    BULLISH = "bullish"
+from annotated_types import Ge, Gt, Le, Lt
+import numpy as np
 
+from .parameters_enums import (
+    GrowthScenarioType,
+    MarketConditionType,
+    PlatformMaturity,
+    RetentionModelType,
+    GrowthScenarioLiteral,
+    MarketConditionLiteral,
+    PlatformMaturityLiteral,
+    RetentionModelLiteral,
+    MaturityParams,
+    MATURITY_ADJUSTMENTS,
+    maturity_params,
+)
 
-class MarketConditionType(str, Enum):
-    """Macro market condition affecting growth"""
-    BEAR = "bear"
-    NEUTRAL = "neutral"
-    BULL = "bull"
 
+_TM = TypeVar('_TM', bound='_TrustedModel')
 
-class PlatformMaturity(str, Enum):
+_NO_ADJUSTMENTS: Mapping[str, float] = MappingProxyType({})
+
+# Issue #5: highest allowed burn_rate + buyback_percent
+MAX_COMBINED_DEFLATION = 0.50
+
+
+def _enum_value(value: Any) -> Any:
+    """Accept a str-Enum member wherever its plain string value is accepted"""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Literal field types that also take the matching Enum members (callers
+# still pass e.g. PlatformMaturity.GROWING); stored as the plain string
+GrowthScenarioField = Annotated[GrowthScenarioLiteral, BeforeValidator(_enum_value)]
+MarketConditionField = Annotated[MarketConditionLiteral, BeforeValidator(_enum_value)]
+PlatformMaturityField = Annotated[PlatformMaturityLiteral, BeforeValidator(_enum_value)]
+RetentionModelField = Annotated[RetentionModelLiteral, BeforeValidator(_enum_value)]
+
+
+class _TrustedModel(BaseModel):
     """
-    Platform maturity tier that affects realistic parameter ranges.
+    Base for parameter models that internal code also builds from
+    known-good values, skipping pydantic validation via trusted().
     
-    Different maturity levels have different expected metrics for:
-    - Customer Acquisition Costs (CAC)
-    - Conversion rates (paid subscriptions)
-    - Ad CPM rates and fill rates
-    - User engagement metrics
-    
-    Based on industry benchmarks from App Annie, AppsFlyer, and public
-    company filings (Meta, Snap, Pinterest 10-K reports).
+    Frozen, so one instance can be shared by every simulation that uses it.
     """
-    LAUNCH = "launch"           # 0-6 months: Low CPM, low conversion, high CAC
-    GROWING = "growing"         # 6-18 months: Improving metrics
-    ESTABLISHED = "established" # 18+ months: Industry-standard rates
+    # extra stays 'ignore': serialized parameters include the computed
+    # totals, and API clients may send such payloads back unchanged
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances='never',
+    )
+    
+    __trusted_defaults__: ClassVar[Dict[str, Any]] = {}
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # trusted() uses model_construct, which skips every validator.
+        # Refuse validators here so the fast path can never bypass one.
+        decorators = cls.__pydantic_decorators__
+        if (decorators.field_validators or decorators.model_validators
+                or decorators.validators or decorators.root_validators):
+            raise TypeError(
+                f"{cls.__name__} declares validators; "
+                f"{cls.__name__}.trusted() would bypass them"
+            )
+        # Immutable defaults resolved once, so trusted() passes them in and
+        # model_construct only has to copy mutable ones and run factories
+        cls.__trusted_defaults__ = {
+            name: field.default
+            for name, field in cls.model_fields.items()
+            if not field.is_required() and field.default_factory is None
+            and not isinstance(field.default, (list, dict, set))
+        }
+    
+    @classmethod
+    def trusted(cls: Type[_TM], **overrides: Any) -> _TM:
+        """
+        Build from already-valid internal values without validation.
+        
+        Field bounds (ge/le) are not checked, so API/user input must still
+        go through the normal constructor.
+        """
+        return cls.model_construct(
+            _fields_set=set(overrides),
+            **{**cls.__trusted_defaults__, **overrides},
+        )
+    
+    @classmethod
+    def shared_default(cls: Type[_TM]) -> _TM:
+        """Shared all-defaults instance, built once per class"""
+        return _default_instance(cls)
 
 
-class RetentionModelType(str, Enum):
-    """Retention curve model selection"""
-    SOCIAL_APP = "social_app"
-    CRYPTO_APP = "crypto_app"
-    GAMING = "gaming"
-    UTILITY = "utility"
-    CUSTOM = "custom"
+@lru_cache(maxsize=None)
+def _default_instance(cls: Type[_TM]) -> _TM:
+    return cls.trusted()
 
 
-# Maturity-based default adjustments
-# These multiply/adjust base parameters based on platform maturity
-# Updated Nov 2025: Made "launch" settings viable for profitability
-MATURITY_ADJUSTMENTS = {
-    PlatformMaturity.LAUNCH: {
-        # Launch platform - lower metrics but still viable
-        'cac_multiplier': 1.3,          # 30% higher CAC for new brand
-        'conversion_rate': 0.015,       # 1.5% paid conversion
-        'ad_fill_rate': 0.20,           # 20% ad fill rate (was 10%)
-        'banner_cpm': 0.50,             # $0.50 banner CPM (was $0.25)
-        'video_cpm': 2.00,              # $2.00 video CPM (was $1.00)
-        'profile_sales_monthly': 1,     # Some early sales
-        'avg_profile_price': 20,        # Low prices
-        'nft_percentage': 0.001,        # 0.1% NFT mints
-        'creator_percentage': 0.12,     # 12% are creators
-        'staking_participation': 0.10,  # 10% stake tokens (WhitePaper)
-    },
-    PlatformMaturity.GROWING: {
-        'cac_multiplier': 1.15,         # 15% higher CAC
-        'conversion_rate': 0.025,       # 2.5% paid conversion
-        'ad_fill_rate': 0.40,           # 40% ad fill rate
-        'banner_cpm': 3.00,             # $3.00 banner CPM
-        'video_cpm': 10.00,             # $10.00 video CPM
-        'profile_sales_monthly': 8,     # Active trading
-        'avg_profile_price': 60,        # Growing prices
-        'nft_percentage': 0.005,        # 0.5% NFT mints
-        'creator_percentage': 0.15,     # 15% are creators
-        'staking_participation': 0.10,  # 10% stake tokens (WhitePaper)
-    },
-    PlatformMaturity.ESTABLISHED: {
-        'cac_multiplier': 1.0,          # Base CAC
-        'conversion_rate': 0.04,        # 4% paid conversion
-        'ad_fill_rate': 0.70,           # 70% ad fill rate
-        'banner_cpm': 8.00,             # $8.00 banner CPM
-        'video_cpm': 25.00,             # $25.00 video CPM
-        'profile_sales_monthly': 20,    # Active marketplace
-        'avg_profile_price': 100,       # Established prices
-        'nft_percentage': 0.01,         # 1% NFT mints
-        'creator_percentage': 0.18,     # 18% are creators
-        'staking_participation': 0.10,  # 10% stake tokens (WhitePaper)
-    },
-}
+@lru_cache(maxsize=None)
+def _field_bounds(cls: Type[BaseModel]) -> Dict[str, Tuple[float, float]]:
+    """
+    Numeric (low, high) bounds per field from its ge/gt/le/lt constraints.
+    
+    Both ends are inclusive: an exclusive gt/lt bound becomes the nearest
+    float strictly inside it, so clipping to the bounds stays valid.
+    """
+    bounds = {}
+    for name, field in cls.model_fields.items():
+        low, high = -np.inf, np.inf
+        for constraint in field.metadata:
+            if isinstance(constraint, Ge):
+                low = float(constraint.ge)
+            elif isinstance(constraint, Gt):
+                low = float(np.nextafter(constraint.gt, np.inf))
+            elif isinstance(constraint, Le):
+                high = float(constraint.le)
+            elif isinstance(constraint, Lt):
+                high = float(np.nextafter(constraint.lt, -np.inf))
+        bounds[name] = (low, high)
+    return bounds
 
 
-class ComplianceCosts(BaseModel):
+class ComplianceCosts(_TrustedModel):
     """
     Regulatory and compliance costs - Issue #13 fix.
     
@@ -130,6 +178,9 @@ class ComplianceCosts(BaseModel):
         description="GDPR/privacy compliance monthly"
     )
     
+    # Derived on read rather than cached at construction, so copies made
+    # with model_copy(update=...) report the total of their own fields
+    @computed_field
     @property
     def monthly_total(self) -> float:
         """Total monthly compliance cost (amortized)"""
@@ -144,16 +195,16 @@ class ComplianceCosts(BaseModel):
     @classmethod
     def minimal(cls) -> 'ComplianceCosts':
         """Minimal compliance for very early stage / MVP"""
-        return cls(
-            kyc_aml_monthly=0,
-            legal_monthly=500,
-            insurance_monthly=0,
-            audit_quarterly=0,
-            gdpr_privacy_monthly=100,
+        return cls.trusted(
+            kyc_aml_monthly=0.0,
+            legal_monthly=500.0,
+            insurance_monthly=0.0,
+            audit_quarterly=0.0,
+            gdpr_privacy_monthly=100.0,
         )
 
 
-class RegionalComplianceCosts(BaseModel):
+class RegionalComplianceCosts(_TrustedModel):
     """
     Regional compliance costs by jurisdiction.
     
@@ -209,6 +260,9 @@ class RegionalComplianceCosts(BaseModel):
         description="Ongoing legal counsel retainer"
     )
     
+    # Totals are derived on read rather than cached at construction, so
+    # copies made with model_copy(update=...) report their own totals
+    @computed_field
     @property
     def year1_total(self) -> float:
         """Year 1 total compliance cost (partial year for new regions)"""
@@ -217,10 +271,10 @@ class RegionalComplianceCosts(BaseModel):
             self.eu_mica_annual * 0.5 +
             self.uk_fca_annual * 0.5 +
             self.apac_annual * 0.25 +  # Later expansion
-            (self.kyc_provider_monthly + self.chainalysis_monthly + 
-             self.legal_retainer_monthly) * 12
+            self.monthly_ongoing * 12
         )
     
+    @computed_field
     @property
     def year2_total(self) -> float:
         """Year 2+ full compliance cost"""
@@ -229,10 +283,10 @@ class RegionalComplianceCosts(BaseModel):
             self.eu_mica_annual +
             self.uk_fca_annual +
             self.apac_annual +
-            (self.kyc_provider_monthly + self.chainalysis_monthly + 
-             self.legal_retainer_monthly) * 12
+            self.monthly_ongoing * 12
         )
     
+    @computed_field
     @property
     def monthly_ongoing(self) -> float:
         """Monthly ongoing costs (providers + retainer)"""
@@ -247,7 +301,8 @@ class RegionalComplianceCosts(BaseModel):
 # FUTURE MODULES (2026-2028) - All disabled by default
 # =============================================================================
 
-class VChainParameters(BaseModel):
+
+class VChainParameters(_TrustedModel):
     """
     VChain cross-chain network parameters.
     
@@ -341,7 +396,7 @@ class VChainParameters(BaseModel):
     )
 
 
-class MarketplaceParameters(BaseModel):
+class MarketplaceParameters(_TrustedModel):
     """
     Marketplace physical/digital goods parameters.
     
@@ -471,7 +526,7 @@ class MarketplaceParameters(BaseModel):
     )
 
 
-class BusinessHubParameters(BaseModel):
+class BusinessHubParameters(_TrustedModel):
     """
     Business Hub freelancer/startup ecosystem parameters.
     
@@ -629,7 +684,7 @@ class BusinessHubParameters(BaseModel):
     )
 
 
-class CrossPlatformParameters(BaseModel):
+class CrossPlatformParameters(_TrustedModel):
     """
     Cross-platform content sharing and account renting parameters.
     
@@ -779,7 +834,7 @@ class CrossPlatformParameters(BaseModel):
     )
 
 
-class ReferralParameters(BaseModel):
+class ReferralParameters(_TrustedModel):
     """
     Referral program configuration (2025 Standards).
     
@@ -827,7 +882,7 @@ class ReferralParameters(BaseModel):
     )
 
 
-class PointsParameters(BaseModel):
+class PointsParameters(_TrustedModel):
     """
     Pre-launch points system configuration (2025 Standards).
     
@@ -877,7 +932,7 @@ class PointsParameters(BaseModel):
     )
 
 
-class FiveAStarConfig(BaseModel):
+class FiveAStarConfig(_TrustedModel):
     """
     Configuration for a single 5A star pillar.
     
@@ -910,7 +965,7 @@ class FiveAStarConfig(BaseModel):
     )
 
 
-class FiveAPolicyParameters(BaseModel):
+class FiveAPolicyParameters(_TrustedModel):
     """
     5A Policy gamification configuration.
     
@@ -1046,7 +1101,7 @@ class FiveAPolicyParameters(BaseModel):
     )
 
 
-class GaslessParameters(BaseModel):
+class GaslessParameters(_TrustedModel):
     """
     Gasless onboarding configuration (2025 Standards).
     
@@ -1093,7 +1148,7 @@ class GaslessParameters(BaseModel):
     )
 
 
-class OrganicGrowthParameters(BaseModel):
+class OrganicGrowthParameters(_TrustedModel):
     """
     Organic user growth configuration (December 2025).
     
@@ -1179,7 +1234,7 @@ class OrganicGrowthParameters(BaseModel):
     )
 
 
-class RetentionParameters(BaseModel):
+class RetentionParameters(_TrustedModel):
     """
     User retention configuration - Issue #1 fix.
     
@@ -1188,8 +1243,8 @@ class RetentionParameters(BaseModel):
     - AppsFlyer State of App Marketing 2024
     - Adjust Mobile App Trends 2024
     """
-    model_type: RetentionModelType = Field(
-        default=RetentionModelType.SOCIAL_APP,
+    model_type: RetentionModelField = Field(
+        default=RetentionModelType.SOCIAL_APP.value,
         description="Which retention curve model to use"
     )
     platform_age_months: int = Field(
@@ -1221,10 +1276,13 @@ class SimulationParameters(BaseModel):
     
     All defaults updated to 2024-2025 industry benchmarks.
     """
+    # Frozen: simulations derive variants with model_copy(update=...) and
+    # share one instance's nested models instead of mutating them
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
     
     # === PLATFORM MATURITY (NEW) ===
-    platform_maturity: PlatformMaturity = Field(
-        default=PlatformMaturity.LAUNCH,
+    platform_maturity: PlatformMaturityField = Field(
+        default=PlatformMaturity.LAUNCH.value,
         description="Platform maturity tier (affects realistic ranges)"
     )
     auto_adjust_for_maturity: bool = Field(
@@ -1234,7 +1292,7 @@ class SimulationParameters(BaseModel):
     
     # === RETENTION MODEL (NEW - Issue #1) ===
     retention: RetentionParameters = Field(
-        default_factory=RetentionParameters,
+        default_factory=RetentionParameters.shared_default,
         description="User retention configuration"
     )
     apply_retention: bool = Field(
@@ -1244,7 +1302,7 @@ class SimulationParameters(BaseModel):
     
     # === COMPLIANCE COSTS (NEW - Issue #13) ===
     compliance: ComplianceCosts = Field(
-        default_factory=ComplianceCosts,
+        default_factory=ComplianceCosts.shared_default,
         description="Regulatory and compliance costs"
     )
     regional_compliance: Optional[RegionalComplianceCosts] = Field(
@@ -1257,56 +1315,56 @@ class SimulationParameters(BaseModel):
     )
     
     # === FUTURE MODULES (2026-2028) - All disabled by default ===
-    vchain: Optional[VChainParameters] = Field(
-        default=None,
+    vchain: VChainParameters = Field(
+        default_factory=VChainParameters.shared_default,
         description="VChain cross-chain network parameters"
     )
-    marketplace: Optional[MarketplaceParameters] = Field(
-        default=None,
+    marketplace: MarketplaceParameters = Field(
+        default_factory=MarketplaceParameters.shared_default,
         description="Marketplace physical/digital goods parameters"
     )
-    business_hub: Optional[BusinessHubParameters] = Field(
-        default=None,
+    business_hub: BusinessHubParameters = Field(
+        default_factory=BusinessHubParameters.shared_default,
         description="Business Hub freelancer/startup parameters"
     )
-    cross_platform: Optional[CrossPlatformParameters] = Field(
-        default=None,
+    cross_platform: CrossPlatformParameters = Field(
+        default_factory=CrossPlatformParameters.shared_default,
         description="Cross-platform content sharing parameters"
     )
     
     # === PRE-LAUNCH MODULES (NEW - Nov 2025) ===
     referral: Optional[ReferralParameters] = Field(
-        default_factory=ReferralParameters,
+        default_factory=ReferralParameters.shared_default,
         description="Referral program parameters"
     )
     points: Optional[PointsParameters] = Field(
-        default_factory=PointsParameters,
+        default_factory=PointsParameters.shared_default,
         description="Pre-launch points system parameters"
     )
     gasless: Optional[GaslessParameters] = Field(
-        default_factory=GaslessParameters,
+        default_factory=GaslessParameters.shared_default,
         description="Gasless onboarding parameters"
     )
     
     # === 5A POLICY GAMIFICATION (Dec 2025) ===
     five_a: Optional[FiveAPolicyParameters] = Field(
-        default_factory=FiveAPolicyParameters,
+        default_factory=FiveAPolicyParameters.shared_default,
         description="5A Policy gamification parameters (Identity, Accuracy, Agility, Activity, Approved)"
     )
     
     # === ORGANIC USER GROWTH (Dec 2025) ===
     organic_growth: Optional[OrganicGrowthParameters] = Field(
-        default_factory=OrganicGrowthParameters,
+        default_factory=OrganicGrowthParameters.shared_default,
         description="Organic user growth parameters (word-of-mouth, app store, network effects)"
     )
     
     # === GROWTH SCENARIO SETTINGS (NEW - Nov 2025) ===
-    growth_scenario: GrowthScenarioType = Field(
-        default=GrowthScenarioType.BASE,
+    growth_scenario: GrowthScenarioField = Field(
+        default=GrowthScenarioType.BASE.value,
         description="Growth scenario for user projections (conservative, base, bullish)"
     )
-    market_condition: MarketConditionType = Field(
-        default=MarketConditionType.NEUTRAL,
+    market_condition: MarketConditionField = Field(
+        default=MarketConditionType.NEUTRAL.value,
         description="Macro market condition affecting growth (bear, neutral, bull)"
     )
     starting_waitlist_users: int = Field(
@@ -1748,12 +1806,15 @@ class SimulationParameters(BaseModel):
     max_daily_reward_usd: float = Field(default=15, ge=1, description="Max daily reward per user in USD")
 
     # === VALIDATION ===
-    @field_validator('burn_rate', 'buyback_percent')
+    @field_validator('vchain', 'marketplace', 'business_hub', 'cross_platform', mode='before')
     @classmethod
-    def validate_deflation_rates(cls, v: float) -> float:
-        """Ensure individual deflation rates are within limits"""
-        if v > 0.25:
-            raise ValueError("Individual burn/buyback rate cannot exceed 25%")
+    def default_disabled_future_module(cls, v: Any, info: ValidationInfo) -> Any:
+        """
+        Map an explicit null to the shared disabled instance, so the
+        simulation can test `params.vchain.enable_vchain` without a None check.
+        """
+        if v is None:
+            return cls.model_fields[info.field_name].default_factory()
         return v
     
     @model_validator(mode='after')
@@ -1763,43 +1824,74 @@ class SimulationParameters(BaseModel):
         Total deflation > 50% is extremely aggressive but allowed for simulation.
         """
         total_deflation = self.burn_rate + self.buyback_percent
-        if total_deflation > 0.50:
+        if total_deflation > MAX_COMBINED_DEFLATION:
             raise ValueError(
                 f"Combined burn ({self.burn_rate*100}%) + buyback ({self.buyback_percent*100}%) "
                 f"= {total_deflation*100}% exceeds maximum of 50%"
             )
         return self
     
-    def get_maturity_adjustments(self) -> dict:
-        """Get parameter adjustments for current maturity tier"""
-        return MATURITY_ADJUSTMENTS.get(self.platform_maturity, {})
+    @classmethod
+    def sweep_variant(
+        cls,
+        template: 'SimulationParameters',
+        **overrides: Any,
+    ) -> 'SimulationParameters':
+        """
+        Cheap copy of a validated template with a few fields overridden.
+        
+        Meant for parameter sweeps (Monte Carlo): only the overridden
+        fields change and nothing is re-validated, so callers must keep
+        the overrides in range themselves. Keys that are not fields are
+        ignored, as the normal constructor would.
+        """
+        update = {
+            name: value for name, value in overrides.items()
+            if name in cls.model_fields
+        }
+        return template.model_copy(update=update)
+    
+    @classmethod
+    def field_bounds(cls, names: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Inclusive (lows, highs) arrays of the declared bounds for the given fields.
+        
+        Lets Monte Carlo clip whole sets of draws to the model's own
+        constraints in one vectorized call. Unknown names and unbounded
+        sides map to -inf/inf.
+        """
+        bounds = _field_bounds(cls)
+        unbounded = (-np.inf, np.inf)
+        pairs = [bounds.get(name, unbounded) for name in names]
+        lows = np.array([low for low, _ in pairs], dtype=np.float64)
+        highs = np.array([high for _, high in pairs], dtype=np.float64)
+        return lows, highs
+    
+    def get_maturity_adjustments(self) -> Mapping[str, float]:
+        """Get (read-only) parameter adjustments for current maturity tier"""
+        return MATURITY_ADJUSTMENTS.get(self.platform_maturity, _NO_ADJUSTMENTS)
     
     def get_effective_conversion_rate(self) -> float:
         """Get conversion rate adjusted for platform maturity"""
         if not self.auto_adjust_for_maturity:
             return self.verification_rate
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('conversion_rate', self.verification_rate)
+        return maturity_params(self.platform_maturity).conversion_rate
     
     def get_effective_ad_fill_rate(self) -> float:
         """Get ad fill rate adjusted for platform maturity"""
         if not self.auto_adjust_for_maturity:
             return self.ad_fill_rate
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('ad_fill_rate', self.ad_fill_rate)
+        return maturity_params(self.platform_maturity).ad_fill_rate
     
     def get_effective_cpm(self) -> tuple:
         """Get CPM rates adjusted for platform maturity"""
         if not self.auto_adjust_for_maturity:
             return (self.banner_cpm, self.video_cpm)
         
-        adjustments = self.get_maturity_adjustments()
-        return (
-            adjustments.get('banner_cpm', self.banner_cpm),
-            adjustments.get('video_cpm', self.video_cpm)
-        )
+        adjustments = maturity_params(self.platform_maturity)
+        return (adjustments.banner_cpm, adjustments.video_cpm)
     
     # Issue #7 Fix: Add maturity-adjusted profile marketplace getters
     def get_effective_monthly_sales(self) -> int:
@@ -1807,24 +1899,21 @@ class SimulationParameters(BaseModel):
         if not self.auto_adjust_for_maturity:
             return self.monthly_sales
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('profile_sales_monthly', self.monthly_sales)
+        return maturity_params(self.platform_maturity).profile_sales_monthly
     
     def get_effective_avg_profile_price(self) -> float:
         """Get average profile price adjusted for platform maturity"""
         if not self.auto_adjust_for_maturity:
             return self.avg_profile_price
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('avg_profile_price', self.avg_profile_price)
+        return maturity_params(self.platform_maturity).avg_profile_price
     
     def get_effective_nft_percentage(self) -> float:
         """Get NFT minting percentage adjusted for platform maturity"""
         if not self.auto_adjust_for_maturity:
             return self.nft_mint_percentage
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('nft_percentage', self.nft_mint_percentage)
+        return maturity_params(self.platform_maturity).nft_percentage
     
     def get_effective_creator_percentage(self) -> float:
         """Get creator percentage adjusted for platform maturity"""
@@ -1832,8 +1921,7 @@ class SimulationParameters(BaseModel):
         if not self.auto_adjust_for_maturity:
             return creator_pct
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('creator_percentage', creator_pct)
+        return maturity_params(self.platform_maturity).creator_percentage
     
     def get_effective_staking_participation(self) -> float:
         """
@@ -1850,19 +1938,18 @@ class SimulationParameters(BaseModel):
         if not self.auto_adjust_for_maturity:
             return self.staking_participation_rate
         
-        adjustments = self.get_maturity_adjustments()
-        return adjustments.get('staking_participation', self.staking_participation_rate)
+        return maturity_params(self.platform_maturity).staking_participation
     
     def get_future_modules_enabled(self) -> list:
         """Return list of enabled future modules"""
         enabled = []
-        if self.vchain and self.vchain.enable_vchain:
+        if self.vchain.enable_vchain:
             enabled.append('vchain')
-        if self.marketplace and self.marketplace.enable_marketplace:
+        if self.marketplace.enable_marketplace:
             enabled.append('marketplace')
-        if self.business_hub and self.business_hub.enable_business_hub:
+        if self.business_hub.enable_business_hub:
             enabled.append('business_hub')
-        if self.cross_platform and self.cross_platform.enable_cross_platform:
+        if self.cross_platform.enable_cross_platform:
             enabled.append('cross_platform')
         return enabled
     
@@ -1955,9 +2042,6 @@ class SimulationParameters(BaseModel):
         
         return annual_budget * distribution.get(month_in_year, 0)
 
-    class Config:
-        populate_by_name = True
-
 
 class MonteCarloOptions(BaseModel):
     """Options for Monte Carlo simulation"""
@@ -1986,3 +2070,22 @@ class MonthlyProgressionOptions(BaseModel):
         default=True,
         description="Use growth scenario projections instead of CAC-based calculations"
     )
+
+
+class StressTestOptions(BaseModel):
+    """Options for running all sensitivity stress test scenarios"""
+    base_metrics: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Baseline metrics (token_price, monthly_users, retention_rate, monthly_revenue, liquidity, cac)"
+    )
+
+
+class SensitivityMonteCarloOptions(BaseModel):
+    """Options for Monte Carlo sensitivity analysis"""
+    base_params: Dict[str, float] = Field(min_length=1, description="Base parameter values")
+    param_ranges: Dict[str, Tuple[float, float]] = Field(
+        default_factory=dict,
+        description="Sampling range per parameter, as (min, max) or (max, min)"
+    )
+    iterations: int = Field(default=1000, ge=100, le=10000, description="Number of iterations")
+    seed: Optional[int] = Field(default=None, description="Random seed for reproducibility")
@@ -0,0 +1,149 @@
+"""
+Enums and maturity lookup tables for simulation parameters.
+
+Kept free of pydantic so code that only needs the enum types or the
+per-tier adjustment table does not have to build the parameter models.
+Re-exported from app.models.parameters.
+"""
+
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping, NamedTuple, Tuple, get_args
+
+
+class GrowthScenarioType(str, Enum):
+    """Growth scenario selection for user projections"""
+    CONSERVATIVE = "conservative"
+    BASE = "base"
+    BULLISH = "bullish"
+
+
+class MarketConditionType(str, Enum):
+    """Macro market condition affecting growth"""
+    BEAR = "bear"
+    NEUTRAL = "neutral"
+    BULL = "bull"
+
+
+class PlatformMaturity(str, Enum):
+    """
+    Platform maturity tier that affects realistic parameter ranges.
+    
+    Different maturity levels have different expected metrics for:
+    - Customer Acquisition Costs (CAC)
+    - Conversion rates (paid subscriptions)
+    - Ad CPM rates and fill rates
+    - User engagement metrics
+    
+    Based on industry benchmarks from App Annie, AppsFlyer, and public
+    company filings (Meta, Snap, Pinterest 10-K reports).
+    """
+    LAUNCH = "launch"           # 0-6 months: Low CPM, low conversion, high CAC
+    GROWING = "growing"         # 6-18 months: Improving metrics
+    ESTABLISHED = "established" # 18+ months: Industry-standard rates
+
+
+class RetentionModelType(str, Enum):
+    """Retention curve model selection"""
+    SOCIAL_APP = "social_app"
+    CRYPTO_APP = "crypto_app"
+    GAMING = "gaming"
+    UTILITY = "utility"
+    CUSTOM = "custom"
+
+
+# Literal twins of the enums above, used as pydantic field types: a Literal
+# validates with a set membership check instead of building the Enum member
+GrowthScenarioLiteral = Literal["conservative", "base", "bullish"]
+MarketConditionLiteral = Literal["bear", "neutral", "bull"]
+PlatformMaturityLiteral = Literal["launch", "growing", "established"]
+RetentionModelLiteral = Literal["social_app", "crypto_app", "gaming", "utility", "custom"]
+
+for _enum, _literal in (
+    (GrowthScenarioType, GrowthScenarioLiteral),
+    (MarketConditionType, MarketConditionLiteral),
+    (PlatformMaturity, PlatformMaturityLiteral),
+    (RetentionModelType, RetentionModelLiteral),
+):
+    if get_args(_literal) != tuple(member.value for member in _enum):
+        raise TypeError(f"Literal values out of sync with {_enum.__name__}")
+del _enum, _literal
+
+
+class MaturityParams(NamedTuple):
+    """Parameter adjustments for a single platform maturity tier"""
+    cac_multiplier: float
+    conversion_rate: float
+    ad_fill_rate: float
+    banner_cpm: float
+    video_cpm: float
+    profile_sales_monthly: int
+    avg_profile_price: float
+    nft_percentage: float
+    creator_percentage: float
+    staking_participation: float
+
+
+# Maturity-based default adjustments
+# These multiply/adjust base parameters based on platform maturity
+# Updated Nov 2025: Made "launch" settings viable for profitability
+# Rows are indexed by _MATURITY_INDEX so per-month reads are a tuple index
+# plus an attribute load instead of two dict probes.
+_MATURITY_TABLE: Tuple[MaturityParams, ...] = (
+    # Launch platform - lower metrics but still viable
+    MaturityParams(
+        cac_multiplier=1.3,             # 30% higher CAC for new brand
+        conversion_rate=0.015,          # 1.5% paid conversion
+        ad_fill_rate=0.20,              # 20% ad fill rate (was 10%)
+        banner_cpm=0.50,                # $0.50 banner CPM (was $0.25)
+        video_cpm=2.00,                 # $2.00 video CPM (was $1.00)
+        profile_sales_monthly=1,        # Some early sales
+        avg_profile_price=20,           # Low prices
+        nft_percentage=0.001,           # 0.1% NFT mints
+        creator_percentage=0.12,        # 12% are creators
+        staking_participation=0.10,     # 10% stake tokens (WhitePaper)
+    ),
+    MaturityParams(
+        cac_multiplier=1.15,            # 15% higher CAC
+        conversion_rate=0.025,          # 2.5% paid conversion
+        ad_fill_rate=0.40,              # 40% ad fill rate
+        banner_cpm=3.00,                # $3.00 banner CPM
+        video_cpm=10.00,                # $10.00 video CPM
+        profile_sales_monthly=8,        # Active trading
+        avg_profile_price=60,           # Growing prices
+        nft_percentage=0.005,           # 0.5% NFT mints
+        creator_percentage=0.15,        # 15% are creators
+        staking_participation=0.10,     # 10% stake tokens (WhitePaper)
+    ),
+    MaturityParams(
+        cac_multiplier=1.0,             # Base CAC
+        conversion_rate=0.04,           # 4% paid conversion
+        ad_fill_rate=0.70,              # 70% ad fill rate
+        banner_cpm=8.00,                # $8.00 banner CPM
+        video_cpm=25.00,                # $25.00 video CPM
+        profile_sales_monthly=20,       # Active marketplace
+        avg_profile_price=100,          # Established prices
+        nft_percentage=0.01,            # 1% NFT mints
+        creator_percentage=0.18,        # 18% are creators
+        staking_participation=0.10,     # 10% stake tokens (WhitePaper)
+    ),
+)
+
+_MATURITY_INDEX: Dict[PlatformMaturity, int] = {
+    PlatformMaturity.LAUNCH: 0,
+    PlatformMaturity.GROWING: 1,
+    PlatformMaturity.ESTABLISHED: 2,
+}
+
+
+def maturity_params(maturity: PlatformMaturity) -> MaturityParams:
+    """Get the adjustment row for a maturity tier"""
+    return _MATURITY_TABLE[_MATURITY_INDEX[maturity]]
+
+
+# Read-only mapping view of the table, kept for API responses and
+# dict-style callers; read-only so no caller can edit the shared tiers
+MATURITY_ADJUSTMENTS: Mapping[PlatformMaturity, Mapping[str, float]] = MappingProxyType({
+    maturity: MappingProxyType(_MATURITY_TABLE[index]._asdict())
+    for maturity, index in _MATURITY_INDEX.items()
+})
@@ -4,13 +4,15 @@ REST API endpoints for simulations.
 Updated to include monthly progression endpoint (Issue #16).
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from typing import Dict, Any
 from app.models import (
     SimulationParameters,
     MonteCarloOptions,
     AgentBasedOptions,
     MonthlyProgressionOptions,
+    StressTestOptions,
+    SensitivityMonteCarloOptions,
     SimulationResult,
     MonteCarloResult,
     AgentBasedResult,
@@ -29,6 +31,7 @@ from app.core.growth_scenarios import (
     MARKET_CONDITIONS,
     get_all_scenario_comparison,
 )
+from app.core.sensitivity import run_all_stress_tests, run_monte_carlo_sensitivity
 from app.core.retention import (
     VCOIN_RETENTION,
     SOCIAL_APP_RETENTION,
@@ -37,6 +40,8 @@ from app.core.retention import (
     UTILITY_RETENTION,
 )
 from app.services.simulation_runner import SimulationRunner
+import asyncio
+import json
 import uuid
 
 router = APIRouter()
@@ -296,6 +301,49 @@ async def simulate_monthly_progression(options: MonthlyProgressionOptions):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/sensitivity/stress-tests")
+async def sensitivity_stress_tests(options: StressTestOptions, request: Request):
+    """
+    Run all predefined stress test scenarios against the baseline metrics.
+    
+    Executed in the application process pool so the event loop (and
+    WebSocket streaming) is never blocked by the CPU-bound work.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            request.app.state.pool,
+            run_all_stress_tests,
+            options.base_metrics,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/sensitivity/monte-carlo")
+async def sensitivity_monte_carlo(options: SensitivityMonteCarloOptions, request: Request):
+    """
+    Run Monte Carlo sensitivity analysis (P5/P25/P50/P75/P95 outcomes).
+    
+    Executed in the application process pool, like the stress tests.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            request.app.state.pool,
+            run_monte_carlo_sensitivity,
+            options.base_params,
+            options.param_ranges,
+            options.iterations,
+            options.seed,
+        )
+    except ValueError as e:
+        # Invalid parameters are a client error, not a server one
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/retention-curves")
 async def get_retention_curves():
     """
@@ -332,34 +380,44 @@ async def get_retention_curves():
     return curves
 
 
-@router.get("/platform-maturity-tiers")
-async def get_platform_maturity_tiers():
-    """
-    Get platform maturity tier definitions and their parameter adjustments.
-    Useful for showing users what each tier means.
-    """
-    return {
+# Tier definitions are static, so the response body is serialized once
+# at import (with the same settings as FastAPI's JSONResponse)
+_PLATFORM_MATURITY_TIERS_JSON = json.dumps(
+    {
         "tiers": [
             {
                 "id": "launch",
                 "name": "Launch Phase",
                 "description": "0-6 months: New platform with limited brand recognition",
-                "adjustments": MATURITY_ADJUSTMENTS[PlatformMaturity.LAUNCH],
+                "adjustments": dict(MATURITY_ADJUSTMENTS[PlatformMaturity.LAUNCH]),
             },
             {
                 "id": "growing",
                 "name": "Growth Phase",
                 "description": "6-18 months: Gaining traction, improving metrics",
-                "adjustments": MATURITY_ADJUSTMENTS[PlatformMaturity.GROWING],
+                "adjustments": dict(MATURITY_ADJUSTMENTS[PlatformMaturity.GROWING]),
             },
             {
                 "id": "established",
                 "name": "Established",
                 "description": "18+ months: Mature platform with industry-standard rates",
-                "adjustments": MATURITY_ADJUSTMENTS[PlatformMaturity.ESTABLISHED],
+                "adjustments": dict(MATURITY_ADJUSTMENTS[PlatformMaturity.ESTABLISHED]),
             },
         ]
-    }
+    },
+    ensure_ascii=False,
+    allow_nan=False,
+    separators=(",", ":"),
+).encode("utf-8")
+
+
+@router.get("/platform-maturity-tiers")
+async def get_platform_maturity_tiers():
+    """
+    Get platform maturity tier definitions and their parameter adjustments.
+    Useful for showing users what each tier means.
+    """
+    return Response(content=_PLATFORM_MATURITY_TIERS_JSON, media_type="application/json")
 
 
 @router.get("/presets")
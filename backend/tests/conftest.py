@@ -0,0 +1,13 @@
+"""Shared pytest fixtures"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope='module')
+def client():
+    # Entering the client runs the app lifespan (process pool startup)
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,50 @@
+"""Tests for the compliance cost models"""
+
+from app.models import ComplianceCosts, RegionalComplianceCosts
+
+
+def test_monthly_total_amortizes_quarterly_audit():
+    costs = ComplianceCosts()
+    assert costs.monthly_total == 500 + 1000 + 500 + 2500 / 3 + 250
+
+
+def test_monthly_total_follows_model_copy_update():
+    costs = ComplianceCosts().model_copy(update={'legal_monthly': 100000.0})
+    assert costs.monthly_total == ComplianceCosts(legal_monthly=100000).monthly_total
+
+
+def test_monthly_total_is_serialized():
+    assert ComplianceCosts().model_dump()['monthly_total'] == ComplianceCosts().monthly_total
+
+
+def test_regional_totals():
+    costs = RegionalComplianceCosts()
+    ongoing = 2000 + 3000 + 5000
+    assert costs.monthly_ongoing == ongoing
+    assert costs.year1_total == 50000 + 50000 + 25000 + 25000 + ongoing * 12
+    assert costs.year2_total == 100000 + 100000 + 50000 + 100000 + ongoing * 12
+
+
+def test_regional_totals_follow_model_copy_update():
+    update = {'us_annual': 0.0, 'kyc_provider_monthly': 0.0}
+    copied = RegionalComplianceCosts().model_copy(update=update)
+    fresh = RegionalComplianceCosts(**update)
+    assert copied.year1_total == fresh.year1_total
+    assert copied.year2_total == fresh.year2_total
+    assert copied.monthly_ongoing == fresh.monthly_ongoing
+
+
+def test_geo_blocking_states_stay_a_list():
+    costs = RegionalComplianceCosts(us_geo_blocking_states=['NY'])
+    assert costs.us_geo_blocking_states == ['NY']
+    assert RegionalComplianceCosts().us_geo_blocking_states == ['NY', 'HI']
+    assert RegionalComplianceCosts.trusted().us_geo_blocking_states == ['NY', 'HI']
+
+
+def test_regional_trusted_defaults_match_validated_defaults():
+    validated = RegionalComplianceCosts()
+    trusted = RegionalComplianceCosts.trusted()
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    # List defaults are rebuilt per instance, never shared
+    assert trusted.us_geo_blocking_states is not validated.us_geo_blocking_states
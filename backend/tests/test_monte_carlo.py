@@ -0,0 +1,37 @@
+"""Tests for the Monte Carlo engine"""
+
+import numpy as np
+import pytest
+
+from app.models import SimulationParameters
+from app.models.parameters import MAX_COMBINED_DEFLATION
+from app.core.monte_carlo import add_noise_to_parameters
+
+
+NOISY_FIELDS = [
+    'token_price',
+    'verification_rate',
+    'posts_per_user',
+    'ad_cpm_multiplier',
+    'cac_north_america_consumer',
+    'cac_global_low_income_consumer',
+    'burn_rate',
+    'buyback_percent',
+]
+
+
+@pytest.mark.parametrize('overrides', [
+    {},
+    {'burn_rate': 0.25, 'buyback_percent': 0.0},
+])
+def test_noisy_variants_stay_valid(overrides):
+    params = SimulationParameters(**overrides)
+    lows, highs = SimulationParameters.field_bounds(NOISY_FIELDS)
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        variant = add_noise_to_parameters(params, rng)
+        values = np.array([getattr(variant, name) for name in NOISY_FIELDS])
+        assert ((values >= lows) & (values <= highs)).all()
+        assert variant.burn_rate + variant.buyback_percent <= MAX_COMBINED_DEFLATION
+        # Whatever sweep_variant produced must also pass full validation
+        SimulationParameters(**variant.model_dump())
@@ -0,0 +1,115 @@
+"""Tests for SimulationParameters and its nested parameter models"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydantic import Field, ValidationError
+
+from app.models import (
+    SimulationParameters,
+    RetentionParameters,
+    ComplianceCosts,
+    VChainParameters,
+    MarketplaceParameters,
+    BusinessHubParameters,
+    CrossPlatformParameters,
+    ReferralParameters,
+    PointsParameters,
+    GaslessParameters,
+    PlatformMaturity,
+    GrowthScenarioType,
+    MarketConditionType,
+    RetentionModelType,
+)
+from app.models.parameters import FiveAPolicyParameters, OrganicGrowthParameters
+
+
+@pytest.mark.parametrize('value', [PlatformMaturity.GROWING, 'growing'])
+def test_platform_maturity_accepts_enum_and_string(value):
+    params = SimulationParameters(platform_maturity=value)
+    assert params.platform_maturity == 'growing'
+    assert type(params.platform_maturity) is str
+
+
+@pytest.mark.parametrize('scenario', [GrowthScenarioType.BULLISH, 'bullish'])
+@pytest.mark.parametrize('condition', [MarketConditionType.BEAR, 'bear'])
+def test_growth_and_market_accept_enum_and_string(scenario, condition):
+    params = SimulationParameters(growth_scenario=scenario, market_condition=condition)
+    assert (params.growth_scenario, params.market_condition) == ('bullish', 'bear')
+
+
+@pytest.mark.parametrize('value', [RetentionModelType.GAMING, 'gaming'])
+def test_retention_model_type_accepts_enum_and_string(value):
+    assert RetentionParameters(model_type=value).model_type == 'gaming'
+
+
+def test_unknown_maturity_is_rejected():
+    with pytest.raises(ValidationError):
+        SimulationParameters(platform_maturity='mature')
+
+
+TRUSTED_MODELS = [
+    RetentionParameters,
+    ComplianceCosts,
+    VChainParameters,
+    MarketplaceParameters,
+    BusinessHubParameters,
+    CrossPlatformParameters,
+    ReferralParameters,
+    PointsParameters,
+    GaslessParameters,
+    FiveAPolicyParameters,
+    OrganicGrowthParameters,
+]
+
+
+@pytest.mark.parametrize('model', TRUSTED_MODELS)
+def test_trusted_defaults_match_validated_defaults(model):
+    validated = model()
+    assert model.trusted() == validated
+    assert model.trusted().model_dump() == validated.model_dump()
+
+
+@pytest.mark.parametrize('model, field', [
+    (RetentionParameters, 'retention'),
+    (ComplianceCosts, 'compliance'),
+    (VChainParameters, 'vchain'),
+    (MarketplaceParameters, 'marketplace'),
+    (BusinessHubParameters, 'business_hub'),
+    (CrossPlatformParameters, 'cross_platform'),
+    (ReferralParameters, 'referral'),
+    (PointsParameters, 'points'),
+    (GaslessParameters, 'gasless'),
+    (FiveAPolicyParameters, 'five_a'),
+    (OrganicGrowthParameters, 'organic_growth'),
+])
+def test_shared_default_matches_validated_default(model, field):
+    validated = model()
+    assert model.shared_default() == validated
+    assert model.shared_default() is model.shared_default()
+    assert getattr(SimulationParameters(), field) == validated
+
+
+def test_field_bounds_keep_exclusive_bounds_open():
+    class BoundedParameters(SimulationParameters):
+        open_rate: float = Field(default=0.5, gt=0, lt=1)
+    
+    lows, highs = BoundedParameters.field_bounds(['open_rate', 'burn_rate'])
+    assert 0 < lows[0] and highs[0] < 1
+    assert (lows[1], highs[1]) == (0, 0.25)
+    clipped = np.clip([-1.0, 2.0], lows[0], highs[0])
+    for value in clipped.tolist():
+        BoundedParameters(open_rate=value)
+
+
+def test_enum_module_imports_without_pydantic():
+    code = (
+        'import sys, app.models.parameters_enums; '
+        'from app.models import PlatformMaturity, MATURITY_ADJUSTMENTS; '
+        'assert "pydantic" not in sys.modules and "numpy" not in sys.modules'
+    )
+    backend = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, '-c', code], cwd=backend, check=True)
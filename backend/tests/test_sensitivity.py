@@ -0,0 +1,77 @@
+"""Tests for the sensitivity analysis helpers"""
+
+import pytest
+
+from app.core.sensitivity import (
+    IMPACT_METRICS,
+    IMPACT_PARAMETERS,
+    StressScenario,
+    generate_impact_matrix,
+    run_monte_carlo_sensitivity,
+    run_stress_test,
+)
+
+
+BASE_PARAMS = {'token_price': 0.03, 'burn_rate': 0.05, 'starting_users': 1000.0}
+
+
+def test_inverted_range_matches_ordered_range():
+    ordered = run_monte_carlo_sensitivity(BASE_PARAMS, {'token_price': (0.01, 0.05)}, 200, seed=3)
+    inverted = run_monte_carlo_sensitivity(BASE_PARAMS, {'token_price': (0.05, 0.01)}, 200, seed=3)
+    assert inverted == ordered
+    sampled = inverted['worst_case']['params']['token_price']
+    assert 0.01 <= sampled <= 0.05
+
+
+def test_ranges_are_not_checked_against_model_fields():
+    # Free-form names: burn_rate here is not SimulationParameters.burn_rate
+    result = run_monte_carlo_sensitivity(BASE_PARAMS, {'burn_rate': (0.0, 0.9)}, 100, seed=1)
+    assert 0.0 <= result['best_case']['params']['burn_rate'] <= 0.9
+
+
+def test_empty_base_params_is_rejected():
+    with pytest.raises(ValueError, match='base_params'):
+        run_monte_carlo_sensitivity({}, {}, 100, seed=1)
+
+
+def test_endpoint_returns_422_for_empty_base_params(client):
+    response = client.post('/api/sensitivity/monte-carlo', json={'base_params': {}, 'iterations': 100})
+    assert response.status_code == 422
+
+
+def test_endpoint_accepts_inverted_range_like_the_function(client):
+    response = client.post('/api/sensitivity/monte-carlo', json={
+        'base_params': BASE_PARAMS,
+        'param_ranges': {'token_price': [0.05, 0.01]},
+        'iterations': 200,
+        'seed': 3,
+    })
+    assert response.status_code == 200
+    expected = run_monte_carlo_sensitivity(BASE_PARAMS, {'token_price': (0.01, 0.05)}, 200, seed=3)
+    assert response.json() == expected
+
+
+def test_impact_matrix_includes_cells_by_default():
+    result = generate_impact_matrix(list(IMPACT_PARAMETERS), list(IMPACT_METRICS))
+    assert result['matrix']['burn_rate']['supply'] == {
+        'impact': -3, 'level': 'High', 'direction': 'negative',
+    }
+    assert result['matrix']['burn_rate']['revenue']['level'] == 'Low'
+
+
+def test_canonical_impact_matrix_is_not_shared_between_calls():
+    first = generate_impact_matrix(list(IMPACT_PARAMETERS), list(IMPACT_METRICS))
+    first['matrix']['burn_rate']['supply']['impact'] = 0
+    first['impact_matrix'][0][0] = 99
+    second = generate_impact_matrix(list(IMPACT_PARAMETERS), list(IMPACT_METRICS))
+    assert second['matrix']['burn_rate']['supply']['impact'] == -3
+    assert second['impact_matrix'][0][0] != 99
+
+
+def test_stress_test_curve_rounds_ties_like_round():
+    base_metrics = {
+        'token_price': 0.03, 'monthly_users': 10000, 'retention_rate': 0.3,
+        'monthly_revenue': 10000, 'liquidity': 100000, 'cac': 50,
+    }
+    result = run_stress_test(StressScenario.LIQUIDITY_CRISIS, base_metrics)
+    assert result['recovery_curve'][3]['retention_rate'] == 0.23